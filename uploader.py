@@ -23,8 +23,8 @@ The GTFS standard deals with transit schedules, geographic information, and serv
 transportation. This code specifically focuses on the 'stops', 'routes', 'stop_times', 'trips', and 'agencies' files 
 within the GTFS specification.
 
-Using the py2neo library, this script automates the extraction of data from these GTFS files, loads it into the Neo4j 
-graph database, creates nodes and relationships for entities such as agencies, routes, trips, stops, 
+Using the official neo4j Bolt driver, this script automates the extraction of data from these GTFS files, loads it into
+the Neo4j graph database, creates nodes and relationships for entities such as agencies, routes, trips, stops, 
 and their related information. The main loading sequence ensures the insertion of the data with proper connections 
 and relationships.
 
@@ -33,7 +33,8 @@ individual files, and create relationships between the entities within the graph
 vary based on the size of data; for instance, it could take approximately 3 hours for 300k nodes (on my old think-pad).
 
 For a complete load, you can instantiate the GNUploader class with the zip_file_path and execute the import with the 
-'execute()' method: Uploader = GNUploader(zip_file_path, username, password, neo4j_service_uri) Uploader.execute()
+'execute()' method, using the uploader as a context manager so the connection is closed afterwards:
+with GNUploader(zip_file_path, username, password, neo4j_service_uri) as Uploader: Uploader.execute()
 
 The 'execute()' method sequentially imports all required GTFS data files and establishes relationships as per the 
 GTFS specification in the Neo4j graph database.
@@ -41,33 +42,156 @@ GTFS specification in the Neo4j graph database.
 Please refer to the individual methods within this script for details on the specific data file imports and their 
 relationships."""
 
-from py2neo import Graph, Relationship, Node, ClientError
+from neo4j import GraphDatabase, Driver, ManagedTransaction
+from neo4j.exceptions import Neo4jError, DriverError
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from threading import Lock
+from operator import itemgetter
 from time import time
 
 import argparse
 import zipfile
+import io
 import tempfile
 import os
 import shutil
+import subprocess
 import csv
 
+
+def gtfs_flag(value: str) -> bool:
+    """
+    Converts a GTFS flag field to bool. Only "1" means yes - "0" or empty (no information) and "2" (no) are False.
+    :param value: Raw value of the field
+    :return: The flag value
+    """
+    return value == "1"
+
+
 class GNUploader(object):
     # file type of the GTFS dataset standard
     gtfs_file_extension = ".txt"
-
-    # Constraint queries - py2neo doesn't seem to work, it uses ON notation when FOR notation
-    # should be used on current version. Queries are written i nCypher language.
-    trip_constraint_query = "CREATE CONSTRAINT FOR (t:Trip) REQUIRE t.trip_id IS UNIQUE"
-    route_constraint_query = "CREATE CONSTRAINT FOR (r:Route) REQUIRE r.route_id IS UNIQUE"
-    agency_constraint_query = "CREATE CONSTRAINT FOR (a:Agency) REQUIRE a.agency_id IS UNIQUE"
-    stop_constraint_query = "CREATE CONSTRAINT FOR (s:Stop) REQUIRE s.stop_id IS UNIQUE"
-    trip_index_query = "CREATE INDEX FOR :Trip(service_id)"
-    stop_times_index_query = "CREATE INDEX FOR :Stop_times(stop_sequence)"
-    stop_index_query = "CREATE INDEX FOR :Stop(name)"
-
-    connect_stop_sequences_query = ("match (s1:Stop_times)-[:PART_OF_TRIP]->(t:Trip), (s2:Stop_times)-["
-                                    ":PART_OF_TRIP]->(t) where s2.stop_sequence=s1.stop_sequence+1 create (s1)-["
-                                    ":PRECEDES]->(s2);")
+    # number of rows sent to the database in a single UNWIND statement
+    chunk_size = 10000
+    # number of rows read from a GTFS file at once, bounding the memory used on large feeds
+    read_chunk_rows = 50000
+    # number of chunks written concurrently, each worker thread uses its own session from the driver pool
+    max_workers = min(8, os.cpu_count() or 1)
+    # driver settings for a one-shot load - a small warm pool just above the number of worker threads
+    driver_config = {
+        "max_connection_pool_size": 16,
+        "connection_acquisition_timeout": 120,
+        "fetch_size": 1000,
+    }
+    # minimal number of seconds between two progress reports
+    progress_interval = 1.0
+
+    # Imported columns of every GTFS file with their pandas dtypes, or converter functions of the raw value.
+    # GTFS IDs are text, even if many feeds only use digits.
+    gtfs_schemas = {
+        "agency": {
+            "agency_id": str,
+            "agency_name": str,
+            "agency_url": str,
+            "agency_timezone": str,
+            "agency_lang": str,
+            "agency_phone": str,
+        },
+        "routes": {
+            "route_id": str,
+            "route_short_name": str,
+            "route_long_name": str,
+            "route_type": "Int64",
+            "agency_id": str,
+        },
+        "trips": {
+            "trip_id": str,
+            "route_id": str,
+            "service_id": str,
+            "trip_headsign": str,
+            "wheelchair_accessible": gtfs_flag,
+            "block_id": str,
+            "direction_id": "Int64",
+            "exceptional": gtfs_flag,
+        },
+        "stops": {
+            "stop_id": str,
+            "stop_name": str,
+            "stop_lat": "float64",
+            "stop_lon": "float64",
+            "zone_id": str,
+            "location_type": str,
+            "parent_station": str,
+            "wheelchair_boarding": "Int64",
+            "platform_code": str,
+        },
+        "stop_times": {
+            "trip_id": str,
+            "arrival_time": str,
+            "departure_time": str,
+            "stop_id": str,
+            "stop_sequence": "Int64",
+            "pickup_type": str,
+            "drop_off_type": str,
+        },
+    }
+    # node property names of the GTFS columns that are not stored under their own name
+    property_names = {
+        "agency_name": "name",
+        "agency_url": "url",
+        "agency_timezone": "timezone",
+        "route_short_name": "short_name",
+        "route_long_name": "long_name",
+        "route_type": "type",
+    }
+
+    # Constraint queries - written in Cypher language, using the FOR notation of the current version.
+    trip_constraint_query = "CREATE CONSTRAINT trip_id_unique IF NOT EXISTS FOR (t:Trip) REQUIRE t.trip_id IS UNIQUE"
+    route_constraint_query = ("CREATE CONSTRAINT route_id_unique IF NOT EXISTS "
+                              "FOR (r:Route) REQUIRE r.route_id IS UNIQUE")
+    agency_constraint_query = ("CREATE CONSTRAINT agency_id_unique IF NOT EXISTS "
+                               "FOR (a:Agency) REQUIRE a.agency_id IS UNIQUE")
+    stop_constraint_query = "CREATE CONSTRAINT stop_id_unique IF NOT EXISTS FOR (s:Stop) REQUIRE s.stop_id IS UNIQUE"
+    stop_times_constraint_query = ("CREATE CONSTRAINT stop_times_id_unique IF NOT EXISTS "
+                                   "FOR (st:Stop_times) REQUIRE st.st_id IS UNIQUE")
+    # Secondary index queries - not needed by the import itself, so they are dropped before loading and built once the
+    # data is in, instead of being maintained for every created node.
+    trip_index_query = "CREATE INDEX trip_service_id IF NOT EXISTS FOR (t:Trip) ON (t.service_id)"
+    stop_times_index_query = ("CREATE INDEX stop_times_stop_sequence IF NOT EXISTS "
+                              "FOR (st:Stop_times) ON (st.stop_sequence)")
+    stop_index_query = "CREATE INDEX stop_name IF NOT EXISTS FOR (s:Stop) ON (s.stop_name)"
+    drop_index_queries = [
+        "DROP INDEX trip_service_id IF EXISTS",
+        "DROP INDEX stop_times_stop_sequence IF EXISTS",
+        "DROP INDEX stop_name IF EXISTS",
+    ]
+
+    # Batched import queries - every chunk of rows is sent as the $rows list parameter and unwound server-side,
+    # so a single round-trip creates the whole chunk. Relationship queries take [parent_key, child_key] pairs.
+    agency_nodes_query = "UNWIND $rows AS r CREATE (n:Agency) SET n = r"
+    route_nodes_query = "UNWIND $rows AS r CREATE (n:Route) SET n = r"
+    route_relationships_query = ("UNWIND $rows AS r MATCH (a:Agency {agency_id: r[0]}) "
+                                 "MATCH (b:Route {route_id: r[1]}) CREATE (a)-[:OPERATES]->(b)")
+    trip_nodes_query = "UNWIND $rows AS r CREATE (n:Trip) SET n = r"
+    trip_relationships_query = ("UNWIND $rows AS r MATCH (a:Route {route_id: r[0]}) "
+                                "MATCH (b:Trip {trip_id: r[1]}) CREATE (a)-[:USES]->(b)")
+    stop_nodes_query = "UNWIND $rows AS r CREATE (n:Stop) SET n = r"
+    stop_relationships_query = ("UNWIND $rows AS r MATCH (p:Stop {stop_id: r[0]}) "
+                                "MATCH (c:Stop {stop_id: r[1]}) CREATE (c)-[:PART_OF]->(p)")
+    # Stop times have no key of their own, so they are connected in the same statement that creates them. Their trip
+    # and stop are looked up directly by the element IDs cached client-side, instead of by the indexed keys.
+    stop_times_nodes_query = ("UNWIND $rows AS r CREATE (st:Stop_times) SET st = r.properties WITH st, r "
+                              "MATCH (t:Trip) WHERE elementId(t) = r.trip "
+                              "MATCH (s:Stop) WHERE elementId(s) = r.stop "
+                              "CREATE (t)<-[:PART_OF_TRIP]-(st)-[:LOCATED_AT]->(s)")
+    trip_element_ids_query = "MATCH (t:Trip) RETURN t.trip_id AS key, elementId(t) AS element_id"
+    stop_element_ids_query = "MATCH (s:Stop) RETURN s.stop_id AS key, elementId(s) AS element_id"
+    # consecutive stop times of a trip, given as [st_id, st_id] pairs
+    precedes_relationships_query = ("UNWIND $rows AS r MATCH (a:Stop_times {st_id: r[0]}) "
+                                    "MATCH (b:Stop_times {st_id: r[1]}) CREATE (a)-[:PRECEDES]->(b)")
+    # first free synthetic stop time ID, so repeated imports do not collide
+    next_stop_times_id_query = "MATCH (st:Stop_times) RETURN coalesce(max(st.st_id), -1) + 1"
 
     def __init__(self,
                  gtfs_zip_path: str,
@@ -81,10 +205,10 @@ class GNUploader(object):
         GTFS specifications (https://developers.google.com/transit/gtfs/reference).
         Currently only uses stops, routes, stop_times, trips and agencies. Expect quite a long runtime, for 300k nodes
         is the runtime about 3hrs.
-        Uses py2neo.
+        Uses the official neo4j Bolt driver.
         Full load example:
-            Uploader = GNUploader(zip_file_path)
-            Uploader.execute_import
+            with GNUploader(zip_file_path, username, password, neo4j_service_uri) as Uploader:
+                Uploader.execute()
         For individual import of new data, you use the same method, as the import is input data driven. No redundant imports
         will be performed. Note that the necessary files (stops, routes, stop_times, trips and agencies) still have to
         be present, even if empty.
@@ -101,69 +225,94 @@ class GNUploader(object):
         self.time_format = "%H:%M:%S"
         self.node_ctr = 0
         self.relationship_ctr = 0
+        self.counter_lock = Lock()
+        # element IDs of the loaded trips and stops by their GTFS keys, filled before importing the stop times
+        self.trip_element_ids = {}
+        self.stop_element_ids = {}
+        # (st_id, stop_sequence) of the last stop time submitted for every trip, to continue trips split across blocks
+        self.last_stop_times = {}
+        self.last_progress_time = 0.0
         # load input files
         self.gtfs_zip_path = gtfs_zip_path
-        self.gtfs_tmp_path = tempfile.mkdtemp()
-        self.__extract_zip()
-        self.stops = os.path.join(self.gtfs_tmp_path, "stops" + self.gtfs_file_extension)
-        self.routes = os.path.join(self.gtfs_tmp_path, "routes" + self.gtfs_file_extension)
-        self.stop_times = os.path.join(self.gtfs_tmp_path, "stop_times" + self.gtfs_file_extension)
-        self.trips = os.path.join(self.gtfs_tmp_path, "trips" + self.gtfs_file_extension)
-        self.agencies = os.path.join(self.gtfs_tmp_path, "agency" + self.gtfs_file_extension)
-        self.__validate_gtfs_files_in_dir()
+        self.gtfs_zip = self.__open_zip()
+        self.stops = "stops" + self.gtfs_file_extension
+        self.routes = "routes" + self.gtfs_file_extension
+        self.stop_times = "stop_times" + self.gtfs_file_extension
+        self.trips = "trips" + self.gtfs_file_extension
+        self.agencies = "agency" + self.gtfs_file_extension
+        self.__validate_gtfs_files_in_zip()
         # connect to neo4j service
-        self.client: Graph = self.__connect_to_neo4j()
+        self.driver: Driver = self.__connect_to_neo4j()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Closes the neo4j driver with its connection pool and the GTFS zip archive.
+        """
+        self.driver.close()
+        self.gtfs_zip.close()
 
-    def __del__(self):
-        shutil.rmtree(self.gtfs_tmp_path)
-        # py2neo Graph connection closes automatically
+    def __connect_to_neo4j(self) -> Driver:
+        """
+        Creates the driver for the neo4j service. The connection itself is opened lazily, see
+        GNUploader.__verify_connection. Exits on failure.
+        :return: neo4j Driver object holding the connection pool
+        """
+        config = dict(self.driver_config)
+        # Plain bolt:// and neo4j:// URIs skip TLS entirely, which is only meant for trusted local links. Use the
+        # bolt+s:// or neo4j+s:// schemes for anything else - the driver then takes the encryption from the scheme.
+        if "+" not in self.neo4j_service_uri.split("://")[0]:
+            config["encrypted"] = False
+        try:
+            return GraphDatabase.driver(self.neo4j_service_uri, auth=(self.username, self.password), **config)
+        except Exception as e:
+            exit(f"Could not connect to the neo4j database on {self.neo4j_service_uri} - error message: {str(e)}")
 
-    def __connect_to_neo4j(self) -> Graph:
+    def __verify_connection(self) -> None:
         """
         Performs connection to the neo4j service. Exits on failure.
-        :return: py2neo Graph object
+        :return: None
         """
         try:
-            graph = Graph(self.neo4j_service_uri, user=self.username, password=self.password)
+            self.driver.verify_connectivity()
             print(f"Successfully connected to {self.neo4j_service_uri} as {self.username}")
-            return graph
         except Exception as e:
             exit(f"Could not connect to the neo4j database on {self.neo4j_service_uri} - error message: {str(e)}")
 
-    def __extract_zip(self) -> str:
+    def __open_zip(self) -> zipfile.ZipFile:
         """
-        Extracts the zip file given by GNUploader.gtfs_zip_path
-        :return: Extracted zip directory (system temporary dir)
+        Opens the zip file given by GNUploader.gtfs_zip_path. The GTFS files are streamed from it without extracting.
+        Exits on failure.
+        :return: The opened zip archive
         """
         try:
-            # create temporary directory
-            # extract archive
-            with zipfile.ZipFile(self.gtfs_zip_path, 'r') as zip_archive:
-                zip_archive.extractall(self.gtfs_tmp_path)
-                print(f"Files extracted into {self.gtfs_tmp_path} successfully!")
-            # return path to archive
-            return self.gtfs_tmp_path
+            return zipfile.ZipFile(self.gtfs_zip_path, 'r')
         # catch general error
         except Exception as e:
-            print(f"ERROR: Could not extract archive {self.gtfs_zip_path}. Error message: {str(e)}")
-            return ""
+            exit(f"ERROR: Could not open archive {self.gtfs_zip_path}. Error message: {str(e)}")
 
-    def __validate_gtfs_files_in_dir(self):
+    def __validate_gtfs_files_in_zip(self):
         """
-        Validates the presence of extracted GTFS files in the temporary directory.
+        Validates the presence of GTFS files in the zip archive.
         :return:
         """
         # validate the file existence and exit execution if it doesn't exist
-        if not os.path.isfile(self.stop_times):
-            exit("Could not find stop_times.txt file. Aborting")
-        if not os.path.isfile(self.stops):
-            exit("Could not find stops.txt file. Aborting")
-        if not os.path.isfile(self.trips):
-            exit("Could not find trips.txt file. Aborting")
-        if not os.path.isfile(self.routes):
-            exit("Could not find routes.txt file. Aborting")
-        if not os.path.isfile(self.agencies):
-            exit("Could not find agency.txt file. Aborting")
+        members = set(self.gtfs_zip.namelist())
+        for gtfs_file in (self.stop_times, self.stops, self.trips, self.routes, self.agencies):
+            if gtfs_file not in members:
+                exit(f"Could not find {gtfs_file} file. Aborting")
+
+    def __open_gtfs(self, gtfs_file: str) -> io.TextIOWrapper:
+        """
+        Opens a GTFS file for reading, streamed directly from the zip archive through a 1 MiB buffer.
+        The utf-8-sig encoding skips the byte order mark if present.
+        :param gtfs_file: Name of the GTFS file in the archive
+        :return: Text stream of the file
+        """
+        return io.TextIOWrapper(io.BufferedReader(self.gtfs_zip.open(gtfs_file), buffer_size=1 << 20),
+                                encoding="utf-8-sig", newline='')
 
     def execute(self) -> None:
         """
@@ -171,23 +320,25 @@ class GNUploader(object):
         :return: None
         """
         start_time = time()
+        self.__verify_connection()
 
-        # create metadata
-        self.__create_constraints_and_indexes()
-        print("Indexes created.")
+        # create metadata - constraints are kept during the load, as the relationships are matched by their keys
+        self.__drop_indexes()
+        self.__create_constraints()
+        print("Constraints created.")
         # main loading sequence
-        self.__import_agencies()
+        self.__ingest(self.agencies, self.agency_nodes_query)
         print(f"Agencies imported.")
-        self.__import_routes()
+        self.__ingest(self.routes, self.route_nodes_query, self.route_relationships_query, ["agency_id", "route_id"])
         print(f"Routes imported.")
-        self.__import_trips()
+        self.__ingest(self.trips, self.trip_nodes_query, self.trip_relationships_query, ["route_id", "trip_id"])
         print(f"Trips imported.")
-        self.__import_stops()
+        self.__ingest(self.stops, self.stop_nodes_query, self.stop_relationships_query, ["parent_station", "stop_id"])
         print(f"Stops imported.")
         self.__import_stop_times()
         print(f"Stop_times imported.")
-        self.__connect_stop_times_sequences()
-        print("Connected stop_times sequences.")
+        self.__create_indexes()
+        print("Indexes created.")
         end_time = time()
         runtime_seconds = end_time - start_time
         runtime_seconds = f"{runtime_seconds / 60} minutes" if runtime_seconds <= 60 else f"{runtime_seconds} seconds"
@@ -195,310 +346,454 @@ class GNUploader(object):
             f"Import complete, took {runtime_seconds} for {self.node_ctr} nodes and {self.relationship_ctr} edges "
             f"imported.")
 
-    def __create_constraints_and_indexes(self) -> None:
+    def execute_bulk(self, neo4j_admin: str = "neo4j-admin", database: str = "neo4j", overwrite: bool = False) -> None:
         """
-        Creates necessary constraints and indexes for the neo4j database. Skips if the constraint already exists.
+        Alternative main method for full loads into an empty database - instead of transactional Cypher, the GTFS files
+        are rewritten into the CSV format of the offline bulk importer and loaded by `neo4j-admin database import full`.
+        This is by far the fastest option, but it has to run on the database server machine and the target database
+        has to be offline (stopped or not created yet). As the importer does not create constraints and indexes, they
+        are created afterwards if the database is reachable by then.
+        Unlike execute(), the files are not streamed in bounded blocks - the (trip_id, stop_sequence) of every stop
+        time is kept in memory to sort out the PRECEDES chains, so the memory use grows with stop_times.txt.
+        The importer refuses to replace an existing database - including the default "neo4j" one of a server that has
+        been started before - unless overwrite is set, which deletes all of its data.
+        :param neo4j_admin: Path to the neo4j-admin executable
+        :param database: Name of the database to import into
+        :param overwrite: Replace the database if it already exists
         :return: None
         """
-        # create constraints
-        print("Creating constraints and indexes..")
-        try:
-            self.client.schema.run(self.trip_constraint_query)
-        except ClientError:
-            print("Agency constraint already exists")
-        try:
-            self.client.run(self.route_constraint_query)
-        except ClientError:
-            print("Route constraint already exists.")
-
-        try:
-            self.client.run(self.agency_constraint_query)
-        except ClientError:
-            print("Agency constraint already exists.")
-
-        try:
-            self.client.run(self.stop_constraint_query)
-        except ClientError:
-            print("Stop constraint already exists.")
-
-        # Create indexes
-        try:
-            self.client.run(self.trip_index_query)
-        except ClientError:
-            print("Trip index already exists.")
-
+        start_time = time()
+        bulk_dir = tempfile.mkdtemp()
         try:
-            self.client.run(self.stop_times_index_query)
-        except ClientError:
-            print("Stop_times index already exists.")
+            node_files, relationship_files = self.__emit_bulk_csvs(bulk_dir)
+            print("Bulk import files created.")
+            command = [neo4j_admin, "database", "import", "full", "--skip-bad-relationships=true"]
+            if overwrite:
+                command.append("--overwrite-destination=true")
+            command += [f"--nodes={node_file}" for node_file in node_files]
+            command += [f"--relationships={relationship_file}" for relationship_file in relationship_files]
+            command.append(database)
+            subprocess.run(command, check=True)
+        except (OSError, subprocess.CalledProcessError) as e:
+            exit(f"Bulk import into {database} failed - error message: {str(e)}")
+        finally:
+            shutil.rmtree(bulk_dir)
+        print(f"Bulk import complete, took {time() - start_time} seconds.")
 
         try:
-            self.client.run(self.stop_index_query)
-        except ClientError:
-            print("Stop index already exists.")
-
-    def __import_agencies(self):
-        column_indices = {}
-        with open(self.agencies, 'r', newline='', encoding="utf8") as file:
-            # Create a CSV reader
-            csv_reader = csv.reader(file)
-
-            # Read the first row to determine column names and skip over blank chars (encoding byte order)
+            self.driver.verify_connectivity()
+            self.__create_constraints(database)
+            self.__create_indexes(database)
+            print(f"Constraints and indexes created in {database}.")
+        except (Neo4jError, DriverError) as e:
+            print(f"Could not create constraints and indexes ({e}). Start the database {database} and run in it "
+                  f"(e.g. cypher-shell -d {database}):")
+            for query in (self.trip_constraint_query, self.route_constraint_query, self.agency_constraint_query,
+                          self.stop_constraint_query, self.stop_times_constraint_query, self.trip_index_query,
+                          self.stop_times_index_query, self.stop_index_query):
+                print(f"\t{query};")
+
+    def __emit_bulk_csvs(self, bulk_dir: str) -> ([str], [str]):
+        """
+        Rewrites the GTFS files into node and relationship CSV files for the neo4j-admin bulk importer, with typed
+        headers (:ID, :LABEL, :START_ID, :END_ID, :TYPE). Stop_times get a synthetic numeric ID and their PRECEDES
+        relationships are computed here from the stop_sequence ordering of each trip.
+        :param bulk_dir: Directory to write the files into
+        :return: Tuple of the node file paths and the relationship file paths
+        """
+        node_files = []
+        relationship_files = []
+
+        def open_output(name: str, header: [str]):
+            path = os.path.join(bulk_dir, name)
+            file = open(path, 'w', newline='', encoding="utf8")
+            writer = csv.writer(file)
+            writer.writerow(header)
+            return path, file, writer
+
+        # agencies
+        path, file, writer = open_output("agency_nodes.csv", [
+            ":ID(Agency)", "agency_id", "name", "url", "timezone", "agency_lang", "agency_phone", ":LABEL"])
+        with file:
+            for agency_id, name, url, timezone, lang, phone in self.__read_columns(
+                    self.agencies,
+                    ["agency_id", "agency_name", "agency_url", "agency_timezone", "agency_lang", "agency_phone"]):
+                writer.writerow([agency_id, agency_id, name, url, timezone, lang, phone, "Agency"])
+        node_files.append(path)
+
+        # routes, operated by agencies
+        path, file, writer = open_output("route_nodes.csv", [
+            ":ID(Route)", "route_id", "short_name", "long_name", "type:int", ":LABEL"])
+        relationship_path, relationship_file, relationship_writer = open_output(
+            "operates_relationships.csv", [":START_ID(Agency)", ":END_ID(Route)", ":TYPE"])
+        with file, relationship_file:
+            for route_id, short_name, long_name, route_type, agency_id in self.__read_columns(
+                    self.routes, ["route_id", "route_short_name", "route_long_name", "route_type", "agency_id"]):
+                writer.writerow([route_id, route_id, short_name, long_name, route_type, "Route"])
+                relationship_writer.writerow([agency_id, route_id, "OPERATES"])
+        node_files.append(path)
+        relationship_files.append(relationship_path)
+
+        # trips, used by routes
+        path, file, writer = open_output("trip_nodes.csv", [
+            ":ID(Trip)", "trip_id", "route_id", "service_id", "trip_headsign", "wheelchair_accessible:boolean",
+            "block_id", "direction_id:int", "exceptional:boolean", ":LABEL"])
+        relationship_path, relationship_file, relationship_writer = open_output(
+            "uses_relationships.csv", [":START_ID(Route)", ":END_ID(Trip)", ":TYPE"])
+        with file, relationship_file:
+            for trip_id, route_id, service_id, headsign, wheelchair, block_id, direction_id, exceptional in \
+                    self.__read_columns(self.trips, ["trip_id", "route_id", "service_id", "trip_headsign",
+                                                     "wheelchair_accessible", "block_id", "direction_id",
+                                                     "exceptional"]):
+                writer.writerow([trip_id, trip_id, route_id, service_id, headsign, str(gtfs_flag(wheelchair)).lower(),
+                                 block_id, direction_id, str(gtfs_flag(exceptional)).lower(), "Trip"])
+                relationship_writer.writerow([route_id, trip_id, "USES"])
+        node_files.append(path)
+        relationship_files.append(relationship_path)
+
+        # stops, part of their parent stations
+        path, file, writer = open_output("stop_nodes.csv", [
+            ":ID(Stop)", "stop_id", "stop_name", "stop_lat:float", "stop_lon:float", "zone_id", "location_type",
+            "parent_station", "wheelchair_boarding:int", "platform_code", ":LABEL"])
+        relationship_path, relationship_file, relationship_writer = open_output(
+            "part_of_relationships.csv", [":START_ID(Stop)", ":END_ID(Stop)", ":TYPE"])
+        with file, relationship_file:
+            for stop in self.__read_columns(self.stops, ["stop_id", "stop_name", "stop_lat", "stop_lon", "zone_id",
+                                                         "location_type", "parent_station", "wheelchair_boarding",
+                                                         "platform_code"]):
+                writer.writerow((stop[0],) + stop + ("Stop",))
+                if stop[0] and stop[6]:
+                    relationship_writer.writerow([stop[0], stop[6], "PART_OF"])
+        node_files.append(path)
+        relationship_files.append(relationship_path)
+
+        # stop times, part of trips, located at stops and preceding each other within the trip
+        path, file, writer = open_output("stop_times_nodes.csv", [
+            ":ID(Stop_times)", "st_id:int", "trip_id", "arrival_time", "departure_time", "stop_id",
+            "stop_sequence:int", "pickup_type", "drop_off_type", ":LABEL"])
+        # END_ID groups differ per relationship type, so each type gets its own file
+        trip_path, trip_file, trip_writer = open_output(
+            "part_of_trip_relationships.csv", [":START_ID(Stop_times)", ":END_ID(Trip)", ":TYPE"])
+        stop_path, stop_file, stop_writer = open_output(
+            "located_at_relationships.csv", [":START_ID(Stop_times)", ":END_ID(Stop)", ":TYPE"])
+        precedes_path, precedes_file, precedes_writer = open_output(
+            "precedes_relationships.csv", [":START_ID(Stop_times)", ":END_ID(Stop_times)", ":TYPE"])
+        # (trip_id, stop_sequence, id) of every stop time, sorted afterwards to find the sequence neighbours
+        sequence = []
+        unsequenced = 0
+        with file, trip_file, stop_file, precedes_file:
+            for st_id, stop_time in enumerate(self.__read_columns(
+                    self.stop_times, ["trip_id", "arrival_time", "departure_time", "stop_id", "stop_sequence",
+                                      "pickup_type", "drop_off_type"])):
+                # stop times without a valid stop_sequence are imported without it and left out of the PRECEDES chain
+                try:
+                    sequence.append((stop_time[0], int(stop_time[4]), st_id))
+                except ValueError:
+                    unsequenced += 1
+                    stop_time = stop_time[:4] + ("",) + stop_time[5:]
+                writer.writerow((st_id, st_id) + stop_time + ("Stop_times",))
+                trip_writer.writerow([st_id, stop_time[0], "PART_OF_TRIP"])
+                stop_writer.writerow([st_id, stop_time[3], "LOCATED_AT"])
+            sequence.sort()
+            for previous, following in zip(sequence, sequence[1:]):
+                if previous[0] == following[0]:
+                    precedes_writer.writerow([previous[2], following[2], "PRECEDES"])
+        node_files.append(path)
+        relationship_files += [trip_path, stop_path, precedes_path]
+        if unsequenced:
+            print(f"Error: {unsequenced} stop times have no valid stop_sequence, they were left out of the PRECEDES "
+                  f"chains.")
+
+        return node_files, relationship_files
+
+    def __read_columns(self, gtfs_file: str, columns: [str]):
+        """
+        Reads the given columns of a GTFS file, row by row. The column positions are resolved once from the header,
+        the rows are then picked by a single itemgetter call each. Optional columns missing in the file are read as
+        empty strings.
+        :param gtfs_file: Name of the GTFS file in the archive
+        :param columns: Names of the columns to read, at least two
+        :return: Generator of tuples of the raw string values, in the order of columns
+        """
+        with self.__open_gtfs(gtfs_file) as file:
+            csv_reader = csv.reader(file, delimiter=self.csv_delim)
+            # Read the first row to determine column names, the byte order mark is skipped by the utf-8-sig codec
             header_row = next(csv_reader)
-            header_row = [s.replace("\ufeff", "") for s in header_row]
-
-            # Populate the column_indices dictionary with column names and their indices
-            for index, column_name in enumerate(header_row):
-                column_indices[column_name] = index
-
-            # Iterate through the remaining rows in the CSV file
-            for row in csv_reader:
-                # Access values by column name using the column_indices dictionary
-                agency_id = self.get_data(row, column_indices, "agency_id", int)
-                agency_name = self.get_data(row, column_indices, "agency_name")
-                agency_url = self.get_data(row, column_indices, "agency_url")
-                agency_timezone = self.get_data(row, column_indices, "agency_timezone")
-                agency_lang = self.get_data(row, column_indices, "agency_lang")
-                agency_phone = self.get_data(row, column_indices, "agency_phone")
-
-                agency_node = Node("Agency",
-                                   agency_id=agency_id,
-                                   name=agency_name,
-                                   url=agency_url,
-                                   timezone=agency_timezone,
-                                   agency_lang=agency_lang,
-                                   agency_phone=agency_phone)
-                self.client.create(agency_node)
-
-    def __import_routes(self) -> None:
-        """
-        Imports routes from the routes.txt file and creates necessary relationship connections.
+            # missing columns point one past the header, to an empty value appended to every row
+            select = itemgetter(*[header_row.index(column) if column in header_row else len(header_row)
+                                  for column in columns])
+            if all(column in header_row for column in columns):
+                yield from map(select, csv_reader)
+            else:
+                yield from (select(row + [""]) for row in csv_reader)
+
+    def __create_constraints(self, database: str = None) -> None:
+        """
+        Creates necessary constraints for the neo4j database. Skips if the constraint already exists.
+        :param database: Name of the database, the server default if None
         :return: None
         """
-        column_indices = {}
-        with open(self.routes, 'r', newline='', encoding="utf8") as file:
-            # Create a CSV reader
-            csv_reader = csv.reader(file)
+        print("Creating constraints..")
+        with self.driver.session(database=database) as session:
+            for query in (self.trip_constraint_query, self.route_constraint_query, self.agency_constraint_query,
+                          self.stop_constraint_query, self.stop_times_constraint_query):
+                session.run(query).consume()
 
-            # Read the first row to determine column names and skip over blank chars (encoding byte order)
-            header_row = next(csv_reader)
-            header_row = [s.replace("\ufeff", "") for s in header_row]
-
-            # Populate the column_indices dictionary with column names and their indices
-            for index, column_name in enumerate(header_row):
-                column_indices[column_name] = index
-
-            # Iterate through the remaining rows in the CSV file
-            for row in csv_reader:
-                route_id = self.get_data(row, column_indices, "route_id")
-                route_short_name = self.get_data(row, column_indices, "route_short_name")
-                route_long_name = self.get_data(row, column_indices, "route_long_name")
-                route_type = self.get_data(row, column_indices, "route_type", int)
-                agency_id = self.get_data(row, column_indices, "agency_id", int)
-                route_node = Node("Route",
-                                  route_id=route_id,
-                                  short_name=route_short_name,
-                                  long_name=route_long_name,
-                                  type=route_type)
-                self.create_node(route_node)
-                agency_node = self.client.nodes.match("Agency", agency_id=agency_id).first()
-                self.create_relationship(agency_node, "OPERATES", route_node)
-
-    def __import_trips(self) -> None:
-        """
-        Imports the trips from the trips.txt file and creates necessary relationship connections.
+    def __drop_indexes(self) -> None:
+        """
+        Drops the secondary indexes, so they are not maintained during the load. Skips the missing ones.
         :return: None
         """
-        column_indices = {}
-        with open(self.trips, 'r', newline='', encoding="utf8") as file:
-            # Create a CSV reader
-            csv_reader = csv.reader(file)
+        with self.driver.session() as session:
+            for query in self.drop_index_queries:
+                session.run(query).consume()
 
-            # Read the first row to determine column names and skip over blank chars (encoding byte order)
-            header_row = next(csv_reader)
-            header_row = [s.replace("\ufeff", "") for s in header_row]
-
-            # Populate the column_indices dictionary with column names and their indices
-            for index, column_name in enumerate(header_row):
-                column_indices[column_name] = index
-            # Iterate through the remaining rows in the CSV file
-            for row in csv_reader:
-                route_id = self.get_data(row, column_indices, "route_id")
-                service_id = self.get_data(row, column_indices, "service_id", int)
-                trip_id = self.get_data(row, column_indices, "trip_id", int)
-                trip_headsign = self.get_data(row, column_indices, "trip_headsign")
-                wheelchair_accessible = bool(self.get_data(row, column_indices, "wheelchair_accessible"))
-                block_id = self.get_data(row, column_indices, "block_id")
-                direction_id = self.get_data(row, column_indices, "direction_id", int)
-                exceptional = self.get_data(row, column_indices, "exceptional", bool)
-
-                trip_node = Node("Trip",
-                                 trip_id=trip_id,
-                                 route_id=route_id,
-                                 service_id=service_id,
-                                 trip_headsing=trip_headsign,
-                                 wheelchair_accessible=wheelchair_accessible,
-                                 block_id=block_id,
-                                 direction_id=direction_id,
-                                 exceptional=exceptional)
-
-                self.create_node(trip_node)
-                route_node = self.client.nodes.match("Route", route_id=route_id).first()
-                self.create_relationship(route_node, "USES", trip_node)
-
-    def __import_stops(self):
-        """
-        Imports the stops from the stops.txt file and creates the relationship connections.
+    def __create_indexes(self, database: str = None) -> None:
+        """
+        Creates the secondary indexes for the neo4j database, in a single pass over the loaded data.
+        Skips if the index already exists.
+        :param database: Name of the database, the server default if None
         :return: None
         """
-        column_indices = {}
-        with open(self.stops, 'r', newline='', encoding="utf8") as file:
-            # Create a CSV reader
-            csv_reader = csv.reader(file)
-
-            # Read the first row to determine column names and skip over blank chars (encoding byte order)
-            header_row = next(csv_reader)
-            header_row = [s.replace("\ufeff", "") for s in header_row]
-
-            # Populate the column_indices dictionary with column names and their indices
-            for index, column_name in enumerate(header_row):
-                column_indices[column_name] = index
-            # Iterate through the remaining rows in the CSV file
-            for row in csv_reader:
-                stop_id = self.get_data(row, column_indices, "stop_id")
-                stop_name = self.get_data(row, column_indices, "stop_name")
-                stop_lat = self.get_data(row, column_indices, "stop_lat", float)
-                stop_lon = self.get_data(row, column_indices, "stop_lon", float)
-                zone_id = self.get_data(row, column_indices, "zone_id", int)
-                location_type = self.get_data(row, column_indices, "location_type")
-                parent_station = self.get_data(row, column_indices, "parent_station")
-                wheelchair_boarding = self.get_data(row, column_indices, "wheelchair_boarding", int)
-                platform_code = self.get_data(row, column_indices, "platform_code")
-
-                stop_node = Node("Stop",
-                                 stop_id=stop_id,
-                                 stop_name=stop_name,
-                                 stop_lat=stop_lat,
-                                 stop_lon=stop_lon,
-                                 zone_id=zone_id,
-                                 location_type=location_type,
-                                 parent_station=parent_station,
-                                 wheelchair_boarding=wheelchair_boarding,
-                                 platform_code=platform_code)
-
-                self.create_node(stop_node)
-
-            for row in csv_reader:
-                current_stop_id = self.get_data(row, column_indices, "stop_id")
-                parent_station = self.get_data(row, column_indices, "parent_station")
-                if parent_station and current_stop_id:
-                    parent_node = self.client.nodes.match("Stop", stop_id=parent_station).first()
-                    child_node = self.client.nodes.match("Stop", stop_id=current_stop_id).first()
-                    self.create_relationship(child_node, "PART OF", parent_node)
-                else:
-                    print(f"Error: Could not load the parent_station {parent_station} of stop {current_stop_id}")
+        print("Creating indexes..")
+        with self.driver.session(database=database) as session:
+            for query in (self.trip_index_query, self.stop_times_index_query, self.stop_index_query):
+                session.run(query).consume()
+
+    def __ingest(self,
+                 gtfs_file: str,
+                 nodes_query: str,
+                 relationships_query: str = None,
+                 link_columns: [str] = None) -> None:
+        """
+        Imports a GTFS file according to its schema in GNUploader.gtfs_schemas - creates a node for every row and
+        connects the nodes afterwards, once all of them are committed, as the parent may come later in the same file.
+        :param gtfs_file: Name of the GTFS file in the archive
+        :param nodes_query: UNWIND query creating the nodes from the row dictionaries
+        :param relationships_query: UNWIND query creating the relationships from [parent_key, child_key] pairs
+        :param link_columns: The parent and child key columns of the relationships
+        :return: None
+        """
+        links = []
+        for data in self.__read_gtfs(gtfs_file):
+            data = self.__plain(data)
+            self.__write_chunks(nodes_query, data.rename(columns=self.property_names).to_dict("records"))
+            if relationships_query:
+                links += data[link_columns].dropna().values.tolist()
+        if relationships_query:
+            connected = self.__write_chunks(relationships_query, links)
+            # rows whose parent is missing are skipped by the MATCH, report them once per file
+            if connected < len(links):
+                print(f"Error: {len(links) - connected} of {len(links)} rows of {gtfs_file} reference a missing "
+                      f"{link_columns[0]}, their relationships were not created.")
 
     def __import_stop_times(self) -> None:
         """
-        Imports the stop times from the stop_times.txt file and creates the relationship connections.
+        Imports the stop times from the stop_times.txt file and creates the relationship connections. The file is
+        streamed in blocks of GNUploader.read_chunk_rows rows to keep the memory bounded. The last trip of a block is
+        carried over to the next one. GTFS does not require the stop times to be grouped by trip though - a trip listed
+        again after other trips is continued from its last submitted stop time, see GNUploader.__continue_trips.
         :return: None
         """
-        column_indices = {}
-        with open(self.stop_times, 'r', newline='', encoding="utf8") as file:
-            # Create a CSV reader
-            csv_reader = csv.reader(file)
+        with self.driver.session() as session:
+            next_id = session.run(self.next_stop_times_id_query).single()[0]
+            self.trip_element_ids = {record["key"]: record["element_id"]
+                                     for record in session.run(self.trip_element_ids_query)}
+            self.stop_element_ids = {record["key"]: record["element_id"]
+                                     for record in session.run(self.stop_element_ids_query)}
+        self.last_stop_times = {}
+        carry = None
+        pending = set()
+        unlinked = 0
+        continued = []
+        unordered = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for block in self.__read_gtfs(self.stop_times):
+                if carry is not None:
+                    block = pd.concat([carry, block], ignore_index=True)
+                if block.empty:
+                    continue
+                # the last trip of the block may continue in the next one
+                last_trip = block["trip_id"].eq(block["trip_id"].iloc[-1]).fillna(False)
+                carry = block[last_trip]
+                complete = block[~last_trip]
+                pending = self.__submit_stop_times(executor, pending, complete, next_id, continued, unordered)
+                unlinked += self.__count_unlinked(complete)
+                next_id += len(complete)
+            if carry is not None:
+                pending = self.__submit_stop_times(executor, pending, carry, next_id, continued, unordered)
+                unlinked += self.__count_unlinked(carry)
+            # propagate errors raised in the worker threads
+            for future in wait(pending).done:
+                future.result()
+        if continued or unordered:
+            print(f"Warning: stop_times.txt is not grouped by trip, {len(continued) + len(unordered)} trips continue "
+                  f"after stop times of other trips.")
+        # the continued trips link to stop times of earlier chunks, which are all committed only now
+        self.__write_chunks(self.precedes_relationships_query, continued)
+        if unordered:
+            print(f"Error: {len(unordered)} trips continue with a lower stop_sequence than listed before, their "
+                  f"PRECEDES chains are incomplete: {', '.join(map(str, unordered[:10]))}")
+        if unlinked:
+            print(f"Error: {unlinked} stop times reference a missing trip_id or stop_id, "
+                  f"they were imported without their relationships.")
+
+    def __count_unlinked(self, stop_times: pd.DataFrame) -> int:
+        """
+        Counts the stop times whose trip or stop is not in the database, the MATCH in the import query skips them.
+        :param stop_times: Block of stop times
+        :return: Number of stop times missing their trip or stop
+        """
+        missing_trip = ~stop_times["trip_id"].isin(self.trip_element_ids.keys())
+        missing_stop = ~stop_times["stop_id"].isin(self.stop_element_ids.keys())
+        return int((missing_trip | missing_stop).sum())
 
-            # Read the first row to determine column names and skip over blank chars (encoding byte order)
-            header_row = next(csv_reader)
-            header_row = [s.replace("\ufeff", "") for s in header_row]
-
-            # Populate the column_indices dictionary with column names and their indices
-            for index, column_name in enumerate(header_row):
-                column_indices[column_name] = index
-            # Iterate through the remaining rows in the CSV file
-            for row in csv_reader:
-                trip_id = self.get_data(row, column_indices, "trip_id")
-                arrival_time = self.get_data(row, column_indices, "arrival_time")
-                departure_time = self.get_data(row, column_indices, "departure_time")
-                stop_id = self.get_data(row, column_indices, "stop_id")
-                stop_sequence = self.get_data(row, column_indices, "stop_sequence")
-                pickup_type = self.get_data(row, column_indices, "pickup_type")
-                drop_off_type = self.get_data(row, column_indices, "drop_off_type")
-
-                stop_times_node = Node("Stop_times",
-                                       trip_id=trip_id,
-                                       arrival_time=arrival_time,
-                                       departure_time=departure_time,
-                                       stop_id=stop_id,
-                                       stop_sequence=stop_sequence,
-                                       pickup_type=pickup_type,
-                                       drop_odd_type=drop_off_type)
-
-                self.create_node(stop_times_node)
-
-                print("trip id: ", trip_id)
-                # dynamic_stop_times_node = self.client.nodes.match("Stop_times", stop_sequence=stop_sequence)
-                q = "match (t:Trip {trip_id: " + trip_id + "}), (s:Stop {stop_id: '" + stop_id + "'}) \
-                create (t)<-[:PART_OF_TRIP]-(st:Stop_times {arrival_time: '" + arrival_time + "', \
-                 departure_time: '" + departure_time + "', stop_sequence: " + stop_sequence + "})-[:LOCATED_AT]->(s);"
-                self.client.run(q)
-
-    def create_node(self, node: Node) -> None:
-        """
-        uses py2neo library to create a new Node in the neo4j database from the input py2neo.Node object.
-        :param node: The py2neo.Node object to create
+    def __submit_stop_times(self, executor: ThreadPoolExecutor, pending: set, stop_times: pd.DataFrame,
+                            first_id: int, continued: [[int, int]], unordered: list) -> set:
+        """
+        Numbers a block of whole trips of stop times and submits it to the executor in chunks written concurrently.
+        :param executor: The executor writing the chunks
+        :param pending: Futures of the chunks submitted so far and not finished yet
+        :param stop_times: Block of stop times holding whole trips
+        :param first_id: First synthetic st_id to assign
+        :param continued: List the PRECEDES pairs continuing trips from earlier blocks are appended to
+        :param unordered: List the IDs of trips continuing out of stop_sequence order are appended to
+        :return: Futures of the submitted chunks that are not finished yet
+        """
+        # Sort by trip and sequence, so the PRECEDES neighbours are consecutive rows of the same trip and no
+        # self-join has to be done on the server
+        stop_times = stop_times.sort_values(["trip_id", "stop_sequence"], ignore_index=True)
+        stop_times["st_id"] = range(first_id, first_id + len(stop_times))
+        self.__continue_trips(stop_times, continued, unordered)
+
+        rows = []
+        for stop_time in self.__plain(stop_times).to_dict("records"):
+            # Chunks are only cut between trips, so concurrent transactions lock disjoint Trip nodes and every
+            # PRECEDES pair stays within one chunk, except for trips split across blocks.
+            # Shared Stop nodes and split trips may still deadlock, which execute_write retries as a transient error.
+            if len(rows) >= self.chunk_size and rows[-1]["trip_id"] != stop_time["trip_id"]:
+                pending.add(executor.submit(self.__write_stop_times_chunk, rows))
+                rows = []
+                # keep the number of chunks waiting in memory bounded
+                if len(pending) >= 2 * self.max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+            rows.append(stop_time)
+        pending.add(executor.submit(self.__write_stop_times_chunk, rows))
+        return pending
+
+    def __continue_trips(self, stop_times: pd.DataFrame, continued: [[int, int]], unordered: list) -> None:
+        """
+        Links the first stop time of every trip already submitted in an earlier block to the last stop time submitted
+        for it, and updates GNUploader.last_stop_times with the last stop times of the block.
+        :param stop_times: Numbered block of stop times, sorted by trip and stop_sequence
+        :param continued: List the [previous st_id, following st_id] pairs are appended to
+        :param unordered: List the IDs of trips continuing with a lower stop_sequence are appended to
         :return: None
         """
-        self.client.create(node)
-        self.node_ctr += 1
-        print(f"Entities: {self.node_ctr + self.relationship_ctr}", end="\r", flush=True)
-
-    def create_relationship(self, from_node: Node, relationship_name: str, to_node: Node) -> None:
+        trips = stop_times.dropna(subset=["trip_id", "stop_sequence"])
+        first = trips.drop_duplicates("trip_id", keep="first")
+        for trip_id, st_id, stop_sequence in zip(first["trip_id"], first["st_id"], first["stop_sequence"]):
+            previous = self.last_stop_times.get(trip_id)
+            if previous is None:
+                continue
+            if previous[1] < stop_sequence:
+                continued.append([previous[0], st_id])
+            else:
+                unordered.append(trip_id)
+        last = trips.drop_duplicates("trip_id", keep="last")
+        self.last_stop_times.update(zip(last["trip_id"], zip(last["st_id"], last["stop_sequence"])))
+
+    def __write_stop_times_chunk(self, rows: [dict]) -> None:
         """
-        Uses py2neo library to create a new Relationship in the neo4j database from the input py2neo.Node objects
-        :param from_node: The "from" node
-        :param relationship_name: Relationship label
-        :param to_node: The "to" node
+        Writes one chunk of whole trips of stop times, sorted by trip and stop_sequence, and connects their sequences.
+        :param rows: List of stop time dictionaries
         :return: None
         """
-        try:
-            self.client.create(Relationship(from_node, relationship_name, to_node))
-            self.relationship_ctr += 1
-            print(f"Entities: {self.node_ctr + self.relationship_ctr}", end="\r", flush=True)
-        except Exception as e:
-            print(
-                f"Error: failed to create relationship ({from_node}, {relationship_name}, {to_node}). Skipping. Error "
-                f"message: {e}")
+        self.__write_chunk(self.stop_times_nodes_query, [{
+            "trip": self.trip_element_ids.get(row["trip_id"]),
+            "stop": self.stop_element_ids.get(row["stop_id"]),
+            "properties": row,
+        } for row in rows])
+        precedes = [[previous["st_id"], following["st_id"]] for previous, following in zip(rows, rows[1:])
+                    if previous["trip_id"] == following["trip_id"]]
+        self.__write_chunk(self.precedes_relationships_query, precedes)
+
+    def __write_chunk(self, query: str, rows: [dict]) -> int:
+        """
+        Sends one chunk of rows to the database as the $rows parameter of the UNWIND query, in a single managed write
+        transaction. Rows whose relationship endpoints are not found are skipped by the MATCH clauses. Thread safe.
+        :param query: UNWIND query creating nodes and/or relationships from the $rows parameter
+        :param rows: List of row dictionaries
+        :return: Number of relationships created
+        """
+        if not rows:
+            return 0
+        # sessions are not thread safe, every call opens its own
+        with self.driver.session() as session:
+            counters = session.execute_write(self.__run_chunk, query, rows)
+        with self.counter_lock:
+            self.node_ctr += counters.nodes_created
+            self.relationship_ctr += counters.relationships_created
+            # report progress at most once per progress_interval, not for every chunk
+            if time() - self.last_progress_time >= self.progress_interval:
+                print(f"Entities: {self.node_ctr + self.relationship_ctr}", end="\r", flush=True)
+                self.last_progress_time = time()
+        return counters.relationships_created
 
     @staticmethod
-    def get_data(row: [str], column_indices, key: str, read_type: type = str):
+    def __run_chunk(tx: ManagedTransaction, query: str, rows: [dict]):
         """
-        Loads data from the row of GTFS file. Uses column_indices and key to dynamically select the corresponding column.
-        Converts the data to given read_type type.
-        :param row: Input row of GTFS file
-        :param column_indices: column index datastructure
-        :param key: column key
-        :param read_type: datatype to return
-        :return: the read value
+        Transaction function for GNUploader.__write_chunk. May be retried by the driver on transient errors.
+        :param tx: The managed transaction
+        :param query: UNWIND query to run
+        :param rows: List of row dictionaries
+        :return: neo4j SummaryCounters of the query
         """
-        try:
-            # Try to convert the value to the specified data type
-            result = read_type(row[column_indices[key]])
-            return result
-        except ValueError as e:
-            print(f"Error when trying to convert type {read_type} of {key}: {e}\n\t (row: {row})")
-            # If a ValueError occurs, return 0 of the specified data type
-            try:
-                return str(row[column_indices[key]])
-            except ValueError:
-                return "0"
-
-    def __connect_stop_times_sequences(self):
-        try:
-            self.client.run(self.connect_stop_sequences_query)
-        except Exception as e:
-            print(f"Error when connecting stop_times sequences: {e}")
+        return tx.run(query, rows=rows).consume().counters
 
+    def __write_chunks(self, query: str, rows: [dict]) -> int:
+        """
+        Sends the rows to the database in chunks of GNUploader.chunk_size, see GNUploader.__write_chunk.
+        :param query: UNWIND query creating nodes and/or relationships from the $rows parameter
+        :param rows: List of row dictionaries
+        :return: Number of relationships created
+        """
+        return sum(self.__write_chunk(query, rows[chunk_start:chunk_start + self.chunk_size])
+                   for chunk_start in range(0, len(rows), self.chunk_size))
+
+    def __read_gtfs(self, gtfs_file: str):
+        """
+        Reads the columns of a GTFS file given by its schema in GNUploader.gtfs_schemas in vectorized blocks of
+        GNUploader.read_chunk_rows rows, converting them to the schema types. Optional columns missing in the file are
+        added as empty. Only empty values are treated as missing.
+        :param gtfs_file: Name of the GTFS file in the archive
+        :return: Generator of DataFrames of the columns, in the order of the schema
+        """
+        schema = self.gtfs_schemas[os.path.splitext(gtfs_file)[0]]
+        converters = {column: dtype for column, dtype in schema.items()
+                      if callable(dtype) and not isinstance(dtype, type)}
+        dtypes = {column: dtype for column, dtype in schema.items() if column not in converters}
+        with self.__open_gtfs(gtfs_file) as file:
+            for data in pd.read_csv(file,
+                                    sep=self.csv_delim,
+                                    usecols=lambda column: column in schema,
+                                    dtype=dtypes,
+                                    converters=converters,
+                                    keep_default_na=False,
+                                    na_values=[""],
+                                    chunksize=self.read_chunk_rows):
+                yield data.reindex(columns=list(schema))
+
+    @staticmethod
+    def __plain(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converts the DataFrame to plain Python values the neo4j driver can send, with None for missing values.
+        :param data: Input DataFrame
+        :return: DataFrame of object dtype
+        """
+        return data.astype(object).where(data.notna(), None)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="GTFS NEO4J Uploader")
@@ -507,15 +802,25 @@ if __name__ == "__main__":
     parser.add_argument("password", type=str, help="Password for the Neo4j database")
     parser.add_argument("neo4j_service_uri", type=str, help="URI of the Neo4j database")
     parser.add_argument("--csv_delim", type=str, default=",", help="CSV delimiter for the GTFS files (default is ',')")
+    parser.add_argument("--bulk", action="store_true",
+                        help="Use the offline neo4j-admin importer for a full load into an empty, stopped database")
+    parser.add_argument("--neo4j_admin", type=str, default="neo4j-admin",
+                        help="Path to the neo4j-admin executable used by --bulk (default is 'neo4j-admin')")
+    parser.add_argument("--database", type=str, default="neo4j",
+                        help="Name of the database --bulk imports into (default is 'neo4j')")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="Let --bulk replace the database if it already exists, deleting all of its data")
 
     args = parser.parse_args()
 
-    uploader = GNUploader(
+    with GNUploader(
         args.gtfs_zip_path,
         args.username,
         args.password,
         args.neo4j_service_uri,
         args.csv_delim
-    )
-
-    uploader.execute()
+    ) as uploader:
+        if args.bulk:
+            uploader.execute_bulk(args.neo4j_admin, args.database, args.overwrite)
+        else:
+            uploader.execute()